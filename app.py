@@ -1,14 +1,18 @@
 import streamlit as st
-import requests
 import plotly.graph_objects as go 
-import pdfplumber
-import pandas as pd
-import io
-import urllib.parse 
-import json 
-import openai 
-import io
-import re
+import numpy as np
+import bisect
+import os
+import pathlib
+import pickle
+import tempfile
+import time
+
+from constants import (
+    CODES_RE, CUBE_EDGES, CUBE_I, CUBE_J, CUBE_K, DASHES_TO_HYPHEN, EXPOSURE_OPTIONS,
+    KZ_HEIGHTS, KZ_SLOPES, KZ_VALUES, PLOTLY_CONFIG, QZ_COEFF, RISK_MAP, STATE_RE,
+    STRUCTURE_TYPES, YEARS_RE,
+)
 
 
 st.set_page_config(page_title="Wind Load Calculator", layout="centered")
@@ -27,10 +31,13 @@ st.markdown("---")
 # ----------------------------------------------------
 st.header("1️⃣ Building Dimensions")
 
-col1, col2, col3 = st.columns(3)
-least_width = col1.number_input("Least Width (ft)", min_value=0.0, value=30.0, format="%.2f")
-longest_width = col2.number_input("Longest Width (ft)", min_value=0.0, value=80.0, format="%.2f")
-height = col3.number_input("Mean Roof Height (ft)", min_value=0.0, value=30.0, format="%.2f")
+# Batched in a form: editing the fields does not rerun the page until submitted
+with st.form("building_dimensions"):
+    col1, col2, col3 = st.columns(3)
+    least_width = col1.number_input("Least Width (ft)", min_value=0.0, value=30.0, format="%.2f")
+    longest_width = col2.number_input("Longest Width (ft)", min_value=0.0, value=80.0, format="%.2f")
+    height = col3.number_input("Mean Roof Height (ft)", min_value=0.0, value=30.0, format="%.2f")
+    st.form_submit_button("Update Dimensions")
 
 st.markdown(f"""
 **Summary:**  
@@ -44,88 +51,78 @@ st.markdown(f"""
 # ----------------------------------------------------
 # Convert to ft-in string
 def ft_in(value):
-    ft = int(value)
-    inches = round((value - ft) * 12)
+    # Round to whole inches first so e.g. 29.999 ft becomes 30′-0″, not 29′-12″
+    ft, inches = divmod(round(value * 12), 12)
     return f"{ft}′-{inches}″"
 
-st.subheader("📦 Building Shape Visualization")
+# Cached on the dimensions; every rerun and session shares the same Figure
+@st.cache_resource(max_entries=32)
+def build_cube_fig(least_width, longest_width, height):
+    # 8 cube vertices as one typed array (float32 keeps the payload small)
+    verts = np.array([
+        [0, 0, 0], [least_width, 0, 0], [least_width, longest_width, 0], [0, longest_width, 0],
+        [0, 0, height], [least_width, 0, height], [least_width, longest_width, height], [0, longest_width, height]
+    ], dtype=np.float32)
+    x, y, z = verts.T
+
+    # Create the 3D cube mesh
+    traces = [
+        go.Mesh3d(
+            x=x, y=y, z=z,
+            i=CUBE_I, j=CUBE_J, k=CUBE_K,
+            color='lightblue',
+            opacity=1.0,
+            flatshading=True,
+            name='Building',
+            showlegend=False
+        )
+    ]
 
-# 8 cube vertices
-x = [0, least_width, least_width, 0, 0, least_width, least_width, 0]
-y = [0, 0, longest_width, longest_width, 0, 0, longest_width, longest_width]
-z = [0, 0, 0, 0, height, height, height, height]
-
-# Triangular faces of the cuboid
-i = [0, 0, 0, 1, 1, 2, 3, 4, 4, 5, 6, 7]
-j = [1, 2, 3, 2, 5, 3, 7, 5, 6, 6, 7, 4]
-k = [5, 3, 4, 5, 6, 7, 4, 6, 7, 4, 4, 5]
-
-# Create the 3D cube mesh
-fig = go.Figure(data=[
-    go.Mesh3d(
-        x=x, y=y, z=z,
-        i=i, j=j, k=k,
-        color='lightblue',
-        opacity=1.0,
-        flatshading=True,
-        name='Building',
-        showlegend=False
-    )
-])
-
-# Add wireframe edges (hidden from legend)
-edges = [
-    (0,1), (1,2), (2,3), (3,0),  # bottom
-    (4,5), (5,6), (6,7), (7,4),  # top
-    (0,4), (1,5), (2,6), (3,7)   # verticals
-]
-for e in edges:
-    fig.add_trace(go.Scatter3d(
-        x=[x[e[0]], x[e[1]]],
-        y=[y[e[0]], y[e[1]]],
-        z=[z[e[0]], z[e[1]]],
+    # Add wireframe edges as one trace; a NaN row breaks the line between edges
+    gaps = np.full((len(CUBE_EDGES), 1, 3), np.nan, dtype=np.float32)
+    ex, ey, ez = np.concatenate([verts[CUBE_EDGES], gaps], axis=1).reshape(-1, 3).T
+    traces.append(go.Scatter3d(
+        x=ex, y=ey, z=ez,
         mode='lines',
         line=dict(color='black', width=4),
+        hoverinfo='skip',
         showlegend=False
     ))
 
-# Add 3D dimension labels
-fig.add_trace(go.Scatter3d(
-    x=[least_width/2], y=[-5], z=[0],
-    mode='text',
-    text=[f"Width: {ft_in(least_width)}"],
-    textposition="bottom center",
-    showlegend=False
-))
-fig.add_trace(go.Scatter3d(
-    x=[-5], y=[longest_width/2], z=[0],
-    mode='text',
-    text=[f"Length: {ft_in(longest_width)}"],
-    textposition="bottom center",
-    showlegend=False
-))
-fig.add_trace(go.Scatter3d(
-    x=[0], y=[0], z=[height + 5],
-    mode='text',
-    text=[f"Height: {ft_in(height)}"],
-    textposition="top center",
-    showlegend=False
-))
-
-# Layout cleanup
-fig.update_layout(
-    scene=dict(
-        xaxis=dict(visible=False),
-        yaxis=dict(visible=False),
-        zaxis=dict(visible=False),
-        aspectmode='data'
-    ),
-    paper_bgcolor="white",
-    margin=dict(r=10, l=10, b=10, t=10),
-    showlegend=False
-)
+    # Add 3D dimension labels
+    traces.append(go.Scatter3d(
+        x=[least_width/2, -5, 0],
+        y=[-5, longest_width/2, 0],
+        z=[0, 0, height + 5],
+        mode='text',
+        text=[
+            f"Width: {ft_in(least_width)}",
+            f"Length: {ft_in(longest_width)}",
+            f"Height: {ft_in(height)}"
+        ],
+        textposition=["bottom center", "bottom center", "top center"],
+        showlegend=False
+    ))
+
+    # Build the figure in one go so the traces and layout are validated once
+    fig = go.Figure(data=traces, layout=go.Layout(
+        scene=dict(
+            xaxis=dict(visible=False),
+            yaxis=dict(visible=False),
+            zaxis=dict(visible=False),
+            aspectmode='data',
+            uirevision="building"  # keep the user's camera angle across reruns
+        ),
+        paper_bgcolor="white",
+        margin=dict(r=10, l=10, b=10, t=10),
+        showlegend=False
+    ))
+
+    return fig
 
-st.plotly_chart(fig, use_container_width=True)
+st.subheader("📦 Building Shape Visualization")
+if st.checkbox("Show 3D visualization", value=True):
+    st.plotly_chart(build_cube_fig(least_width, longest_width, height), use_container_width=True, config=PLOTLY_CONFIG)
 st.markdown("---")
 
 
@@ -134,112 +131,199 @@ st.markdown("---")
 # ----------------------------------------------------
 st.header("2️⃣ Code Jurisdiction Lookup")
 
-# --- Function to extract ICC adoption data directly from the PDF ---
-@st.cache_data(show_spinner=True)
-def load_icc_table_pdfplumber():
-    PDF_URL = "https://www.iccsafe.org/wp-content/uploads/Master-I-Code-Adoption-Chart-1.pdf"
-    response = requests.get(PDF_URL)
-    response.raise_for_status()
-
-    with pdfplumber.open(io.BytesIO(response.content)) as pdf:
-        text = ""
-        for page in pdf.pages:
-            text += page.extract_text() + "\n"
-
-    # Extract lines that look like state rows
-    states = [
-        "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado", "Connecticut",
-        "Delaware", "Florida", "Georgia", "Hawaii", "Idaho", "Illinois", "Indiana",
-        "Iowa", "Kansas", "Kentucky", "Louisiana", "Maine", "Maryland", "Massachusetts",
-        "Michigan", "Minnesota", "Mississippi", "Missouri", "Montana", "Nebraska",
-        "Nevada", "New Hampshire", "New Jersey", "New Mexico", "New York", "North Carolina",
-        "North Dakota", "Ohio", "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island",
-        "South Carolina", "South Dakota", "Tennessee", "Texas", "Utah", "Vermont",
-        "Virginia", "Washington", "West Virginia", "Wisconsin", "Wyoming"
-    ]
+ICC_PDF_URL = "https://www.iccsafe.org/wp-content/uploads/Master-I-Code-Adoption-Chart-1.pdf"
+ICC_CACHE_PATH = pathlib.Path("~/.cache/wind_calc/icc_codes.pkl").expanduser()
+ICC_CACHE_TTL = 86400  # seconds (1 day)
+ICC_MIN_STATES = 45  # fewer parsed states than this is treated as a failed parse
+
+# Shared HTTP session with keep-alive and retries, kept across reruns
+@st.cache_resource
+def get_session():
+    # Imported here so requests only loads once the ICC chart is fetched
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries))
+    session.headers.update({
+        "User-Agent": "streamlit-wind-load-calculator",
+        "Accept-Encoding": "gzip, deflate",
+    })
+    return session
 
-    states_data = []
-    lines = text.split("\n")
+# --- Function to extract ICC adoption data directly from the PDF ---
+# Cached in memory and on disk; revalidated with a conditional GET after the TTL
+@st.cache_resource(ttl=ICC_CACHE_TTL, show_spinner=True)
+def load_icc_table():
+    cached = None
+    try:
+        with ICC_CACHE_PATH.open("rb") as f:
+            cached = pickle.load(f)
+        if not isinstance(cached, dict) or not isinstance(cached.get("codes"), dict):
+            raise TypeError("unexpected ICC cache contents")
+        codes, etag, last_modified = cached["codes"], cached["etag"], cached["last_modified"]
+        age = time.time() - ICC_CACHE_PATH.stat().st_mtime
+    except Exception:
+        # No cache yet, or one that cannot be read back: treat it as a miss
+        cached = None
+
+    headers = {}
+    if cached:
+        if age < ICC_CACHE_TTL:
+            return codes
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    try:
+        fetched = _fetch_icc_pdf(headers)
+        if fetched is not None:
+            pdf_file, response_headers = fetched
+            with pdf_file:
+                state_codes = _parse_icc_pdf(pdf_file)
+    except Exception:
+        # Download or parse failed: serve the stale copy and retry on the next load
+        if cached is None:
+            raise
+        return codes
+    if fetched is None:
+        ICC_CACHE_PATH.touch()
+        return codes
+
+    # Write to a temp file and swap it in so a crash never leaves a truncated cache
+    ICC_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=ICC_CACHE_PATH.parent, delete=False) as f:
+        try:
+            pickle.dump({
+                "etag": response_headers.get("ETag"),
+                "last_modified": response_headers.get("Last-Modified"),
+                "codes": state_codes,
+            }, f)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, ICC_CACHE_PATH)
+    return state_codes
+
+
+# Download the ICC PDF to a temp file; returns (file, headers), or None on 304
+def _fetch_icc_pdf(headers):
+    # Kept in memory up to 4 MB, then spooled to disk
+    pdf_file = tempfile.SpooledTemporaryFile(max_size=4 * 1024 * 1024)
+    try:
+        with get_session().get(ICC_PDF_URL, headers=headers, stream=True, timeout=20) as response:
+            if headers and response.status_code == 304:
+                pdf_file.close()
+                return None
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                pdf_file.write(chunk)
+    except BaseException:
+        pdf_file.close()
+        raise
+    pdf_file.seek(0)
+    return pdf_file, response.headers
+
+
+# Parse the chart's text into a {state: code info} dict
+def _parse_icc_pdf(pdf_file):
+    import pdfplumber
+
+    with pdfplumber.open(pdf_file) as pdf:
+        text = "\n".join(page.extract_text() or "" for page in pdf.pages)
+
+    # Extract lines that look like state rows (first row wins on repeats)
+    codes = {}
+    lines = text.splitlines()
     current_state = None
-    buffer = ""
+    buffer_parts = []
+
+    def flush():
+        code_info = " ".join(buffer_parts).strip()
+        if current_state and code_info:
+            codes.setdefault(current_state, code_info)
 
     for line in lines:
         # If a line starts with a state name, start a new entry
-        if any(line.startswith(s) for s in states):
-            if current_state and buffer.strip():
-                states_data.append([current_state, buffer.strip()])
-            current_state = line.split(" ")[0]
-            buffer = line[len(current_state):].strip()
+        m = STATE_RE.match(line)
+        if m:
+            flush()
+            current_state = m.group(1)
+            buffer_parts = [line[m.end():].strip()]
         else:
-            buffer += " " + line.strip()
+            buffer_parts.append(line.strip())
+
+    flush()
 
-    if current_state and buffer.strip():
-        states_data.append([current_state, buffer.strip()])
+    # A short result means the chart's layout changed; fail instead of caching it
+    if len(codes) < ICC_MIN_STATES:
+        raise ValueError(f"ICC chart parsed to only {len(codes)} states")
 
-    df = pd.DataFrame(states_data, columns=["State", "Code Info"])
-    return df
+    # Sorted by state so the dict doubles as the selectbox options
+    return dict(sorted(codes.items()))
 
 
 # --- Helper Function: Extract Relevant Codes ---
+@st.cache_data(max_entries=64)
 def extract_relevant_codes(code_text):
     """
     Extract building, IBC, ASCE 7, IECC, and ASHRAE codes from the text.
     Works with both keyword-based and compressed numeric-only formats.
     """
     # Normalize
-    text = code_text.upper().replace("–", "-").replace("—", "-")
+    text = code_text.upper().translate(DASHES_TO_HYPHEN)
 
     # Initialize
     building_code = ibc_code = asce_code = iecc_code = ashrae_code = ""
 
     # --- 1️⃣ Try to extract by keywords ---
-    ibc_match = re.search(r"IBC\s*(19|20)\d{2}", text)
-    asce_match = re.search(r"ASCE\s*7[-–]\s*(\d{2})", text)
-    iecc_match = re.search(r"IECC\s*(19|20)\d{2}", text)
-    ashrae_match = re.search(r"(ASHRAE|90\.1)[-\s]*(19|20)\d{2}", text)
-
-    if ibc_match:
-        ibc_code = f"IBC {ibc_match.group(0).split()[-1]}"
-    if asce_match:
-        asce_code = f"ASCE 7-{asce_match.group(1)}"
-    if iecc_match:
-        iecc_code = f"IECC {iecc_match.group(0).split()[-1]}"
-    if ashrae_match:
-        ashrae_code = f"ASHRAE 90.1-{ashrae_match.group(2)}"
+    # First edition found for each code wins
+    editions = {}
+    for m in CODES_RE.finditer(text):
+        editions.setdefault(m.lastgroup, m.group(m.lastgroup))
+        if len(editions) == 4:
+            break
+
+    if "ibc" in editions:
+        ibc_code = f"IBC {editions['ibc']}"
+    if "asce" in editions:
+        asce_code = f"ASCE 7-{editions['asce']}"
+    if "iecc" in editions:
+        iecc_code = f"IECC {editions['iecc']}"
+    if "ashrae" in editions:
+        ashrae_code = f"ASHRAE 90.1-{editions['ashrae']}"
     if ibc_code:
         building_code = ibc_code
 
     # --- 2️⃣ Fallback: numeric compressed form like “15 X 15 09 15 15” ---
     if not any([ibc_code, asce_code, iecc_code, ashrae_code]):
-        years = re.findall(r'\b(0[9]|1[0-9]|2[0-5])\b', text)
-        if len(years) >= 1:
-            ibc_code = f"IBC 20{years[0]}"
+        # Years are listed in IBC, ASCE 7, IECC, ASHRAE order
+        years = YEARS_RE.findall(text)[:4]
+        codes = [f"{label}20{year}" for label, year in zip(("IBC ", "ASCE 7-", "IECC ", "ASHRAE 90.1-"), years)]
+        ibc_code, asce_code, iecc_code, ashrae_code = codes + [""] * (4 - len(codes))
+        if years:
             building_code = f"Building Code 20{years[0]}"
-        if len(years) >= 2:
-            asce_code = f"ASCE 7-20{years[1]}"
-        if len(years) >= 3:
-            iecc_code = f"IECC 20{years[2]}"
-        if len(years) >= 4:
-            ashrae_code = f"ASHRAE 90.1-20{years[3]}"
 
     return building_code, ibc_code, asce_code, iecc_code, ashrae_code
 
 # --- Streamlit App ---
-st.title("US State Building Code Finder 🏗️")
 st.markdown("This app retrieves the latest **ICC Building Code adoption data** directly from the official ICC PDF and extracts key information for each U.S. state.")
 
 # Load PDF and parse data
 with st.spinner("Loading ICC adoption data..."):
-    df_codes = load_icc_table_pdfplumber()
+    state_codes = load_icc_table()
 
 # Dropdown for selecting a state
-state_list = sorted(df_codes["State"].unique())
+state_list = tuple(state_codes)
 selected_state = st.selectbox("Select a U.S. State:", state_list)
 
 # Find selected state info
-state_info = df_codes[df_codes["State"] == selected_state]
-if not state_info.empty:
-    code_text = state_info.iloc[0]["Code Info"]
+code_text = state_codes.get(selected_state)
+if code_text is not None:
     building_code, ibc_code, asce_code, iecc_code, ashrae_code = extract_relevant_codes(code_text)
 
     # st.subheader(f"📍 Building Code Summary for {selected_state}")
@@ -257,15 +341,14 @@ else:
     st.warning("State not found in the current ICC adoption dataset.")
 
 st.markdown("---")
-st.caption("Data Source: [ICC Master I-Code Adoption Chart](https://www.iccsafe.org/wp-content/uploads/Master-I-Code-Adoption-Chart-1.pdf)")
+st.caption(f"Data Source: [ICC Master I-Code Adoption Chart]({ICC_PDF_URL})")
 
 # ----------------------- 
 # 3. RISK CATEGORY 
 # ----------------------- 
 st.header("3️⃣ Risk Category") 
-risk_map = { "I": "Low risk to human life (e.g., storage, barns).", "II": "Typical occupancy (residential, commercial, offices).", "III": "Substantial hazard to human life (schools, large assemblies).", "IV": "Essential facilities (hospitals, emergency services)." } 
-risk_category = st.selectbox( "Select Risk Category:", list(risk_map.keys()), format_func=lambda x: f"Category {x} – {risk_map[x].split('(')[0]}" ) 
-st.info(risk_map[risk_category]) 
+risk_category = st.selectbox( "Select Risk Category:", list(RISK_MAP.keys()), format_func=lambda x: f"Category {x} – {RISK_MAP[x].split('(')[0]}" ) 
+st.info(RISK_MAP[risk_category]) 
 
 # ----------------------- 
 # 4. WIND SPEED 
@@ -283,49 +366,23 @@ st.header("5️⃣ Basic Wind Pressure Calculation (ASCE 7)")
 
 # --- Select Structure Type for Kd ---
 st.subheader("Select Structure Type (for Kd)")
-structure_types = {
-    "Main Wind Force Resisting System (Buildings)": 0.85,
-    "Components and Cladding": 0.85,
-    "Arched Roofs": 0.85,
-    "Circular Domes": 1.0,
-    "Chimneys / Tanks (Square)": 0.90,
-    "Chimneys / Tanks (Hexagonal)": 0.95,
-    "Chimneys / Tanks (Octagonal)": 1.0,
-    "Chimneys / Tanks (Round)": 1.0,
-    "Solid Freestanding Walls or Signs": 0.85,
-    "Open Signs / Single-Plane Frames": 0.85,
-    "Trussed Tower (Triangular / Rectangular)": 0.85,
-    "Trussed Tower (Other Cross Sections)": 0.95
-}
-structure_selection = st.selectbox("Choose structure type:", list(structure_types.keys()))
-Kd = structure_types[structure_selection]
+structure_selection = st.selectbox("Choose structure type:", list(STRUCTURE_TYPES.keys()))
+Kd = STRUCTURE_TYPES[structure_selection]
 st.info(f"**Selected Kd = {Kd:.2f}**")
 
 # --- Surface Roughness / Exposure Category ---
 st.subheader("Select Exposure Category (Surface Roughness)")
-exposure_options = ["B", "C", "D"]
-exposure = st.selectbox("Exposure Category:", exposure_options, index=1)
+exposure = st.selectbox("Exposure Category:", EXPOSURE_OPTIONS, index=1)
 st.caption("Exposure B = urban/suburban, C = open terrain, D = flat/coastal areas")
 
 # --- Compute Kz from Table 26.10-1 ---
+@st.cache_data(max_entries=128)
 def get_kz(height_ft, exposure):
-    # Table 26.10-1 (ASCE 7-16)
-    table = {
-        "B": {15: 0.57, 20: 0.62, 25: 0.66, 30: 0.70, 40: 0.76, 50: 0.81, 60: 0.85, 70: 0.89, 80: 0.93, 90: 0.96, 100: 0.99, 120: 1.04, 140: 1.09, 160: 1.13, 200: 1.20, 250: 1.28, 300: 1.35, 350: 1.41, 400: 1.47, 450: 1.52, 500: 1.56},
-        "C": {15: 0.85, 20: 0.90, 25: 0.94, 30: 0.98, 40: 1.04, 50: 1.09, 60: 1.13, 70: 1.17, 80: 1.21, 90: 1.24, 100: 1.26, 120: 1.31, 140: 1.36, 160: 1.39, 200: 1.46, 250: 1.53, 300: 1.59, 350: 1.64, 400: 1.69, 450: 1.73, 500: 1.77},
-        "D": {15: 1.03, 20: 1.08, 25: 1.12, 30: 1.16, 40: 1.22, 50: 1.27, 60: 1.31, 70: 1.34, 80: 1.38, 90: 1.40, 100: 1.43, 120: 1.48, 140: 1.52, 160: 1.55, 200: 1.61, 250: 1.68, 300: 1.73, 350: 1.78, 400: 1.82, 450: 1.86, 500: 1.89}
-    }
-
-    h = min(max(height_ft, 15), 500)
-    heights = sorted(table[exposure].keys())
-
-    # Linear interpolation
-    for i in range(len(heights)-1):
-        h1, h2 = heights[i], heights[i+1]
-        if h1 <= h <= h2:
-            k1, k2 = table[exposure][h1], table[exposure][h2]
-            return k1 + (k2 - k1) * ((h - h1) / (h2 - h1))
-    return table[exposure][500]
+    h = min(max(height_ft, KZ_HEIGHTS[0]), KZ_HEIGHTS[-1])
+
+    # Linear interpolation on the segment containing h
+    i = min(bisect.bisect_right(KZ_HEIGHTS, h) - 1, len(KZ_HEIGHTS) - 2)
+    return KZ_VALUES[exposure][i] + KZ_SLOPES[exposure][i] * (h - KZ_HEIGHTS[i])
 
 Kz = get_kz(height, exposure)
 st.success(f"Kz (at {height:.1f} ft, Exposure {exposure}) = **{Kz:.3f}**")
@@ -335,7 +392,12 @@ Kzt = 1.0
 Ke = 1.0
 
 # --- Wind Pressure Calculation ---
-q = 0.00256 * Kz * Kzt * Kd * Ke * (V ** 2)
+# Works on a scalar V or a NumPy array of speeds
+@st.cache_data(max_entries=128)
+def compute_q(Kz, Kzt, Kd, Ke, V):
+    return QZ_COEFF * Kz * Kzt * Kd * Ke * np.square(V)
+
+q = compute_q(Kz, Kzt, Kd, Ke, V)
 
 st.markdown("### 💨 Calculated Velocity Pressure")
 st.metric(label="q (psf)", value=f"{q:.2f}")
@@ -351,3 +413,18 @@ st.markdown(f"""
 | Basic Wind Speed | V | {V:.1f} mph | From ASCE Hazard Tool |
 | **Velocity Pressure** | **q** | **{q:.2f} psf** | — |
 """)
+
+# --- Sensitivity to wind speed ---
+if st.checkbox("Show V-sweep chart"):
+    V_sweep = np.linspace(70, 200, 100)
+    q_sweep = compute_q(Kz, Kzt, Kd, Ke, V_sweep)
+
+    sweep_fig = go.Figure(go.Scattergl(x=V_sweep, y=q_sweep, mode='lines', name='q'))
+    sweep_fig.add_vline(x=V, line_dash="dash", line_color="gray")
+    sweep_fig.update_layout(
+        xaxis_title="Basic Wind Speed V (mph)",
+        yaxis_title="q (psf)",
+        margin=dict(r=10, l=10, b=10, t=10),
+        showlegend=False
+    )
+    st.plotly_chart(sweep_fig, use_container_width=True, config=PLOTLY_CONFIG)
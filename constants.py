@@ -0,0 +1,117 @@
+# Lookup tables and patterns used by app.py.
+# Streamlit re-executes app.py top to bottom on every widget interaction, but
+# imported modules are only loaded once per process, so these are built once.
+
+import re
+
+import numpy as np
+
+# ----------------------------------------------------
+# ICC adoption chart
+# ----------------------------------------------------
+STATES = (
+    "Alabama", "Alaska", "Arizona", "Arkansas", "California", "Colorado", "Connecticut",
+    "Delaware", "Florida", "Georgia", "Hawaii", "Idaho", "Illinois", "Indiana",
+    "Iowa", "Kansas", "Kentucky", "Louisiana", "Maine", "Maryland", "Massachusetts",
+    "Michigan", "Minnesota", "Mississippi", "Missouri", "Montana", "Nebraska",
+    "Nevada", "New Hampshire", "New Jersey", "New Mexico", "New York", "North Carolina",
+    "North Dakota", "Ohio", "Oklahoma", "Oregon", "Pennsylvania", "Rhode Island",
+    "South Carolina", "South Dakota", "Tennessee", "Texas", "Utah", "Vermont",
+    "Virginia", "Washington", "West Virginia", "Wisconsin", "Wyoming"
+)
+# Matches a state name at the start of a line. Longest names go first so the
+# alternation always captures the full name; a following letter means the
+# name is only part of a longer word.
+STATE_RE = re.compile(
+    r"^(" + "|".join(map(re.escape, sorted(STATES, key=len, reverse=True))) + r")(?![A-Za-z])"
+)
+
+# En and em dashes are normalized to "-" before matching
+DASHES_TO_HYPHEN = str.maketrans("–—", "--")
+
+# Code references inside a state's (upper-cased) code info text. One named
+# group per code holds its edition, so a single finditer pass finds them all.
+CODES_RE = re.compile(
+    r"IBC\s*(?P<ibc>(?:19|20)\d{2})"
+    r"|ASCE\s*7[-–]\s*(?P<asce>\d{2})"
+    r"|IECC\s*(?P<iecc>(?:19|20)\d{2})"
+    r"|(?:ASHRAE|90\.1)[-\s]*(?P<ashrae>(?:19|20)\d{2})"
+)
+# Two-digit edition years in the compressed numeric form, e.g. "15 X 15 09 15 15"
+YEARS_RE = re.compile(r"\b(?:09|1[0-9]|2[0-5])\b")
+
+# ----------------------------------------------------
+# Risk Category
+# ----------------------------------------------------
+RISK_MAP = {
+    "I": "Low risk to human life (e.g., storage, barns).",
+    "II": "Typical occupancy (residential, commercial, offices).",
+    "III": "Substantial hazard to human life (schools, large assemblies).",
+    "IV": "Essential facilities (hospitals, emergency services).",
+}
+
+# ----------------------------------------------------
+# Directionality factor Kd (Table 26.6-1)
+# ----------------------------------------------------
+STRUCTURE_TYPES = {
+    "Main Wind Force Resisting System (Buildings)": 0.85,
+    "Components and Cladding": 0.85,
+    "Arched Roofs": 0.85,
+    "Circular Domes": 1.0,
+    "Chimneys / Tanks (Square)": 0.90,
+    "Chimneys / Tanks (Hexagonal)": 0.95,
+    "Chimneys / Tanks (Octagonal)": 1.0,
+    "Chimneys / Tanks (Round)": 1.0,
+    "Solid Freestanding Walls or Signs": 0.85,
+    "Open Signs / Single-Plane Frames": 0.85,
+    "Trussed Tower (Triangular / Rectangular)": 0.85,
+    "Trussed Tower (Other Cross Sections)": 0.95
+}
+
+# ----------------------------------------------------
+# Velocity pressure exposure coefficient Kz (Table 26.10-1, ASCE 7-16)
+# ----------------------------------------------------
+EXPOSURE_OPTIONS = ("B", "C", "D")
+
+KZ_TABLE = {
+    "B": {15: 0.57, 20: 0.62, 25: 0.66, 30: 0.70, 40: 0.76, 50: 0.81, 60: 0.85, 70: 0.89, 80: 0.93, 90: 0.96, 100: 0.99, 120: 1.04, 140: 1.09, 160: 1.13, 200: 1.20, 250: 1.28, 300: 1.35, 350: 1.41, 400: 1.47, 450: 1.52, 500: 1.56},
+    "C": {15: 0.85, 20: 0.90, 25: 0.94, 30: 0.98, 40: 1.04, 50: 1.09, 60: 1.13, 70: 1.17, 80: 1.21, 90: 1.24, 100: 1.26, 120: 1.31, 140: 1.36, 160: 1.39, 200: 1.46, 250: 1.53, 300: 1.59, 350: 1.64, 400: 1.69, 450: 1.73, 500: 1.77},
+    "D": {15: 1.03, 20: 1.08, 25: 1.12, 30: 1.16, 40: 1.22, 50: 1.27, 60: 1.31, 70: 1.34, 80: 1.38, 90: 1.40, 100: 1.43, 120: 1.48, 140: 1.52, 160: 1.55, 200: 1.61, 250: 1.68, 300: 1.73, 350: 1.78, 400: 1.82, 450: 1.86, 500: 1.89}
+}
+KZ_HEIGHTS = tuple(sorted(KZ_TABLE["B"]))
+KZ_VALUES = {exp: tuple(table[h] for h in KZ_HEIGHTS) for exp, table in KZ_TABLE.items()}
+# Slope of each segment between consecutive heights, for piecewise-linear interpolation
+KZ_SLOPES = {
+    exp: tuple((v2 - v1) / (h2 - h1) for v1, v2, h1, h2 in zip(values, values[1:], KZ_HEIGHTS, KZ_HEIGHTS[1:]))
+    for exp, values in KZ_VALUES.items()
+}
+
+# ----------------------------------------------------
+# Velocity pressure, q = QZ_COEFF * Kz * Kzt * Kd * Ke * V^2 (psf, V in mph)
+# ----------------------------------------------------
+QZ_COEFF = 0.00256
+
+# ----------------------------------------------------
+# Cuboid geometry for the building visualization
+# Vertices 0-3 are the bottom corners and 4-7 the top corners, both
+# counter-clockwise from the origin.
+# ----------------------------------------------------
+def _read_only(values):
+    arr = np.array(values, dtype=np.int32)
+    arr.setflags(write=False)
+    return arr
+
+# Triangular faces (2 per face: bottom, top, front, back, right, left)
+CUBE_I = _read_only([0, 0, 4, 4, 0, 0, 2, 2, 1, 1, 0, 0])
+CUBE_J = _read_only([1, 2, 5, 6, 1, 5, 3, 7, 2, 6, 3, 7])
+CUBE_K = _read_only([2, 3, 6, 7, 5, 4, 7, 6, 6, 5, 7, 4])
+CUBE_EDGES = _read_only([
+    (0,1), (1,2), (2,3), (3,0),  # bottom
+    (4,5), (5,6), (6,7), (7,4),  # top
+    (0,4), (1,5), (2,6), (3,7)   # verticals
+])
+
+# ----------------------------------------------------
+# Plotly chart options (no logo link in the mode bar)
+# ----------------------------------------------------
+PLOTLY_CONFIG = {"displaylogo": False}